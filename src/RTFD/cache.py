@@ -4,7 +4,6 @@ Cache manager using SQLite for storing library search results.
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import sys
@@ -13,8 +12,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
 
-@dataclass
+from .utils import serialize_response
+
+
+def default_cache_path(filename: str = "cache.db") -> str:
+    """Return the path of a database file in ~/.cache/rtfd, creating the directory if needed."""
+    cache_dir = Path.home() / ".cache" / "rtfd"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return str(cache_dir / filename)
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a cached item."""
 
@@ -37,10 +47,7 @@ class CacheManager:
             db_path: Path to the SQLite database file. If None, uses default location.
         """
         if db_path is None:
-            # Default to ~/.cache/rtfd/cache.db
-            cache_dir = Path.home() / ".cache" / "rtfd"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            db_path = str(cache_dir / "cache.db")
+            db_path = default_cache_path()
 
         self.db_path = db_path
         self._init_db()
@@ -81,9 +88,9 @@ class CacheManager:
                     data_json, timestamp, metadata_json = row
                     return CacheEntry(
                         key=key,
-                        data=json.loads(data_json),
+                        data=orjson.loads(data_json),
                         timestamp=timestamp,
-                        metadata=json.loads(metadata_json) if metadata_json else {},
+                        metadata=orjson.loads(metadata_json) if metadata_json else {},
                     )
         except Exception as e:
             sys.stderr.write(f"Cache read error: {e}\n")
@@ -108,15 +115,29 @@ class CacheManager:
                     """,
                     (
                         key,
-                        json.dumps(data),
+                        serialize_response(data),
                         time.time(),
-                        json.dumps(metadata) if metadata else None,
+                        serialize_response(metadata) if metadata else None,
                     ),
                 )
                 conn.commit()
         except Exception as e:
             sys.stderr.write(f"Cache write error: {e}\n")
 
+    def touch(self, key: str) -> None:
+        """
+        Reset an item's timestamp to now without rewriting its data.
+
+        Args:
+            key: Unique cache key.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("UPDATE cache SET timestamp = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+        except Exception as e:
+            sys.stderr.write(f"Cache touch error: {e}\n")
+
     def invalidate(self, key: str) -> None:
         """
         Remove an item from the cache.
@@ -195,7 +216,7 @@ class CacheManager:
 
                 for key, data_json, timestamp in rows:
                     age_seconds = current_time - timestamp
-                    data = json.loads(data_json)
+                    data = orjson.loads(data_json)
                     data_size = len(data_json.encode("utf-8"))
 
                     entries[key] = {
@@ -23,7 +23,7 @@ PRIORITY_KEYWORDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a documentation section."""
 
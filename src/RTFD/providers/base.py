@@ -10,7 +10,7 @@ from typing import Any
 import httpx
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderMetadata:
     """Metadata describing a provider's capabilities and configuration."""
 
@@ -30,7 +30,7 @@ class ProviderMetadata:
     optional_env_vars: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResult:
     """Standardized result from a provider operation."""
 
@@ -85,6 +85,24 @@ class BaseProvider(ABC):
         """
         return {}
 
+    def get_cache_stats(self) -> dict[str, Any] | None:
+        """
+        Return statistics for a persistent cache the provider keeps, if any.
+
+        Reported by the get_cache_info tool under the provider's name.
+
+        Returns:
+            Dict of cache statistics, or None if the provider has no cache
+        """
+        return None
+
     async def _http_client(self) -> httpx.AsyncClient:
-        """Get configured HTTP client instance."""
+        """
+        Get the configured HTTP client.
+
+        The client is shared by every provider and pooled for the server's lifetime, so
+        use it directly (`client = await self._http_client()`). Do not close it or use it
+        as a context manager (`async with`): that fails on the next request and closes
+        the pool for every other provider.
+        """
         return await self._http_client_factory()
@@ -79,13 +79,13 @@ class CratesProvider(BaseProvider):
         await self._rate_limit()
 
         try:
-            async with await self._http_client() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/crates",
-                    params={"q": query, "per_page": min(per_page, 100), "page": 1},
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = await self._http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/crates",
+                params={"q": query, "per_page": min(per_page, 100), "page": 1},
+            )
+            response.raise_for_status()
+            data = response.json()
 
             # Format the response
             crates = data.get("crates", [])
@@ -129,10 +129,10 @@ class CratesProvider(BaseProvider):
         await self._rate_limit()
 
         try:
-            async with await self._http_client() as client:
-                response = await client.get(f"{self.BASE_URL}/crates/{crate_name}")
-                response.raise_for_status()
-                data = response.json()
+            client = await self._http_client()
+            response = await client.get(f"{self.BASE_URL}/crates/{crate_name}")
+            response.raise_for_status()
+            data = response.json()
 
             crate = data.get("crate", {})
             version = data.get("versions", [{}])[0] if data.get("versions") else {}
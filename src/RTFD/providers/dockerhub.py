@@ -51,10 +51,10 @@ class DockerHubProvider(BaseProvider):
             url = f"{self.DOCKERHUB_API_URL}/search/repositories/"
             params = {"query": query, "page_size": limit}
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                payload = resp.json()
+            client = await self._http_client()
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
+            payload = resp.json()
 
             # Transform results
             results = []
@@ -119,10 +119,10 @@ class DockerHubProvider(BaseProvider):
 
             url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._http_client()
+            resp = await client.get(url)
+            resp.raise_for_status()
+            data = resp.json()
 
             return {
                 "name": data.get("name"),
@@ -262,10 +262,10 @@ class DockerHubProvider(BaseProvider):
 
             url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._http_client()
+            resp = await client.get(url)
+            resp.raise_for_status()
+            data = resp.json()
 
             full_desc = data.get("full_description", "")
 
@@ -296,10 +296,10 @@ class DockerHubProvider(BaseProvider):
             )
 
             # 5. Fetch the Dockerfile
-            async with await self._http_client() as client:
-                resp = await client.get(raw_url)
-                resp.raise_for_status()
-                content = resp.text
+            client = await self._http_client()
+            resp = await client.get(raw_url)
+            resp.raise_for_status()
+            content = resp.text
 
             return {
                 "image": image,
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from typing import Any
+from urllib.parse import quote_plus
 
 import httpx
+import lxml.html
+import orjson
 from bs4 import BeautifulSoup
 from mcp.types import CallToolResult
 
 from ..content_utils import extract_sections, html_to_markdown, prioritize_sections
 from ..utils import (
     USER_AGENT,
-    get_github_token,
+    get_github_headers,
+    get_github_semaphore,
     is_fetch_enabled,
     serialize_response_with_meta,
 )
@@ -143,6 +147,11 @@ GCP_SERVICE_DOCS = {
 }
 
 
+def _visible_text(element: lxml.html.HtmlElement) -> list[str]:
+    """Return the text nodes under element, skipping <script>/<style> contents and comments."""
+    return element.xpath(".//text()[not(ancestor::script or ancestor::style)]")
+
+
 class GcpProvider(BaseProvider):
     """Provider for Google Cloud Platform documentation."""
 
@@ -158,7 +167,7 @@ class GcpProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=True,
             required_env_vars=[],
-            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH"],
+            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH", "GITHUB_MAX_CONCURRENCY"],
         )
 
     async def search_library(self, library: str, limit: int = 5) -> ProviderResult:
@@ -343,20 +352,21 @@ class GcpProvider(BaseProvider):
         Returns:
             List of service metadata from GitHub
         """
-        headers = self._get_github_headers()
+        headers = get_github_headers()
 
         # Search for proto files in googleapis repository
         search_query = f"{query} repo:googleapis/googleapis path:google/cloud"
         params = {"q": search_query, "per_page": str(limit)}
 
-        async with await self._http_client() as client:
+        client = await self._http_client()
+        async with get_github_semaphore():
             resp = await client.get(
                 "https://api.github.com/search/code",
                 params=params,
                 headers=headers,
             )
-            resp.raise_for_status()
-            payload = resp.json()
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
 
         results: list[dict[str, Any]] = []
         for item in payload.get("items", []):
@@ -396,18 +406,6 @@ class GcpProvider(BaseProvider):
 
         return results
 
-    def _get_github_headers(self) -> dict[str, str]:
-        """Build GitHub API headers with optional auth token."""
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
-        token = get_github_token()
-        if token:
-            headers["Authorization"] = f"token {token}"
-        return headers
-
     async def _search_cloud_google_com(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """
         Search cloud.google.com for documentation.
@@ -419,22 +417,23 @@ class GcpProvider(BaseProvider):
         Returns:
             List of service metadata from search results
         """
-        url = f"https://cloud.google.com/search?q={query}"
+        url = f"https://cloud.google.com/search?q={quote_plus(query)}"
         headers = {"User-Agent": USER_AGENT}
 
         try:
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers, follow_redirects=True)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._http_client()
+            resp = await client.get(url, headers=headers, follow_redirects=True)
+            resp.raise_for_status()
+            # Only a few anchors are read, so skip the bs4 wrapper tree entirely
+            doc = lxml.html.fromstring(resp.text)
 
             results: list[dict[str, Any]] = []
 
             # Use the robust selector strategy found during testing
-            search_links = soup.find_all("a", attrs={"track-type": "search-result"})
+            search_links = doc.xpath('//a[@track-type="search-result"]')
 
             for link in search_links:
-                title = link.get_text().strip()
+                title = "".join(_visible_text(link)).strip()
                 href = link.get("href")
 
                 if not href or not title:
@@ -447,8 +446,10 @@ class GcpProvider(BaseProvider):
                 # Try to extract description
                 description = f"Search result for {query}"
                 try:
-                    container = link.parent.parent
-                    full_text = container.get_text(" ", strip=True)
+                    container = link.getparent().getparent()
+                    full_text = " ".join(
+                        text.strip() for text in _visible_text(container) if text.strip()
+                    )
                     # Simple heuristic to get description part
                     desc_text = full_text.replace(title, "", 1).strip()
                     if desc_text:
@@ -511,10 +512,10 @@ class GcpProvider(BaseProvider):
 
             # Fetch and parse HTML documentation
             headers = {"User-Agent": USER_AGENT}
-            async with await self._http_client() as client:
-                resp = await client.get(docs_url, headers=headers)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._http_client()
+            resp = await client.get(docs_url, headers=headers)
+            resp.raise_for_status()
+            soup = BeautifulSoup(resp.text, "lxml")
 
             # Extract main documentation content
 
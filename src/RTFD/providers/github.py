@@ -4,15 +4,35 @@ from __future__ import annotations
 
 import base64
 from collections.abc import Callable
+from itertools import islice
 from typing import Any
 
 import httpx
+import orjson
 from mcp.types import CallToolResult
 
 from ..content_utils import convert_relative_urls
-from ..utils import USER_AGENT, get_github_token, is_fetch_enabled, serialize_response_with_meta
+from ..utils import (
+    cached,
+    get_github_headers,
+    get_github_semaphore,
+    is_fetch_enabled,
+    serialize_response_with_meta,
+)
 from .base import BaseProvider, ProviderMetadata, ProviderResult
 
+# In-memory cache lifetimes (seconds) for search results
+REPO_SEARCH_CACHE_TTL = 120.0
+CODE_SEARCH_CACHE_TTL = 60.0
+
+# GitHub's search API returns at most this many items per page
+MAX_PER_PAGE = 100
+
+
+def _per_page(limit: int) -> str:
+    """Clamp a result limit to the page size range GitHub search accepts."""
+    return str(max(1, min(limit, MAX_PER_PAGE)))
+
 
 class GitHubProvider(BaseProvider):
     """Provider for GitHub repository and code search."""
@@ -37,7 +57,7 @@ class GitHubProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=True,
             required_env_vars=[],
-            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH"],
+            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH", "GITHUB_MAX_CONCURRENCY"],
         )
 
     async def search_library(self, library: str, limit: int = 5) -> ProviderResult:
@@ -57,82 +77,78 @@ class GitHubProvider(BaseProvider):
     async def _search_repos(
         self, query: str, limit: int = 5, language: str | None = "Python"
     ) -> list[dict[str, Any]]:
-        """Query GitHub's repository search API."""
-        headers = self._get_headers()
+        """Query GitHub's repository search API, caching results briefly per query."""
+        return await cached(
+            ("gh_repo", query, language, limit),
+            REPO_SEARCH_CACHE_TTL,
+            lambda: self._fetch_repos(query, limit, language),
+        )
 
-        params = {"q": query, "per_page": str(limit)}
-        if language:
-            params["q"] = f"{query} language:{language}"
+    async def _fetch_repos(
+        self, query: str, limit: int, language: str | None
+    ) -> list[dict[str, Any]]:
+        """Fetch repository search results from the GitHub API."""
+        headers = get_github_headers()
 
-        async with await self._http_client() as client:
+        search_query = f"{query} language:{language}" if language else query
+        params = {"q": search_query, "per_page": _per_page(limit)}
+
+        client = await self._http_client()
+        async with get_github_semaphore():
             resp = await client.get(
                 "https://api.github.com/search/repositories",
                 params=params,
                 headers=headers,
             )
-            resp.raise_for_status()
-            payload = resp.json()
-
-        repos: list[dict[str, Any]] = []
-        for item in payload.get("items", []):
-            repos.append(
-                {
-                    "name": item.get("full_name"),
-                    "description": item.get("description") or "",
-                    "stars": item.get("stargazers_count", 0),
-                    "url": item.get("html_url"),
-                    "default_branch": item.get("default_branch"),
-                }
-            )
-            if len(repos) >= limit:
-                break
-        return repos
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+
+        return [
+            {
+                "name": item.get("full_name"),
+                "description": item.get("description") or "",
+                "stars": item.get("stargazers_count", 0),
+                "url": item.get("html_url"),
+                "default_branch": item.get("default_branch"),
+            }
+            for item in islice(payload.get("items", []), max(limit, 0))
+        ]
 
     async def _search_code(
         self, query: str, repo: str | None = None, limit: int = 5
     ) -> list[dict[str, Any]]:
-        """Search code on GitHub; optionally scoping to a repository."""
-        headers = self._get_headers()
+        """Search code on GitHub; optionally scoping to a repository. Results are cached briefly."""
+        return await cached(
+            ("gh_code", query, repo, limit),
+            CODE_SEARCH_CACHE_TTL,
+            lambda: self._fetch_code(query, repo, limit),
+        )
 
-        search_query = query
-        if repo:
-            search_query = f"{query} repo:{repo}"
+    async def _fetch_code(self, query: str, repo: str | None, limit: int) -> list[dict[str, Any]]:
+        """Fetch code search results from the GitHub API."""
+        headers = get_github_headers()
 
-        params = {"q": search_query, "per_page": str(limit)}
-        async with await self._http_client() as client:
+        search_query = f"{query} repo:{repo}" if repo else query
+        params = {"q": search_query, "per_page": _per_page(limit)}
+        client = await self._http_client()
+        async with get_github_semaphore():
             resp = await client.get(
                 "https://api.github.com/search/code",
                 params=params,
                 headers=headers,
             )
-            resp.raise_for_status()
-            payload = resp.json()
-
-        code_hits: list[dict[str, Any]] = []
-        for item in payload.get("items", []):
-            code_hits.append(
-                {
-                    "name": item.get("name"),
-                    "path": item.get("path"),
-                    "repository": item.get("repository", {}).get("full_name"),
-                    "url": item.get("html_url"),
-                }
-            )
-            if len(code_hits) >= limit:
-                break
-        return code_hits
-
-    def _get_headers(self) -> dict[str, str]:
-        """Build GitHub API headers with optional auth token."""
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
-        token = get_github_token()
-        if token:
-            headers["Authorization"] = f"token {token}"
-        return headers
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+
+        return [
+            {
+                "name": item.get("name"),
+                "path": item.get("path"),
+                "repository": item.get("repository", {}).get("full_name"),
+                "url": item.get("html_url"),
+            }
+            for item in islice(payload.get("items", []), max(limit, 0))
+        ]
 
     async def _fetch_github_readme(
         self, owner: str, repo: str, max_bytes: int = 20480
@@ -149,13 +165,14 @@ class GitHubProvider(BaseProvider):
             Dict with content, size, source info
         """
         try:
-            headers = self._get_headers()
+            headers = get_github_headers()
             url = f"https://api.github.com/repos/{owner}/{repo}/readme"
 
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_github_semaphore():
                 resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
             # Decode base64 content
             content = base64.b64decode(data["content"]).decode("utf-8")
@@ -228,13 +245,14 @@ class GitHubProvider(BaseProvider):
             Dict with list of files and directories
         """
         try:
-            headers = self._get_headers()
+            headers = get_github_headers()
             url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
 
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_github_semaphore():
                 resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
             # Handle single file vs directory
             if isinstance(data, dict):
@@ -295,13 +313,14 @@ class GitHubProvider(BaseProvider):
             Dict with file content and metadata
         """
         try:
-            headers = self._get_headers()
+            headers = get_github_headers()
             url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
 
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_github_semaphore():
                 resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
             # Check if it's a file
             if data.get("type") != "file":
@@ -379,25 +398,26 @@ class GitHubProvider(BaseProvider):
             Dict with file tree structure
         """
         try:
-            headers = self._get_headers()
+            headers = get_github_headers()
 
             # First get the default branch
             repo_url = f"https://api.github.com/repos/{owner}/{repo}"
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_github_semaphore():
                 repo_resp = await client.get(repo_url, headers=headers)
-                repo_resp.raise_for_status()
-                repo_data = repo_resp.json()
-                default_branch = repo_data.get("default_branch", "main")
+            repo_resp.raise_for_status()
+            repo_data = orjson.loads(repo_resp.content)
+            default_branch = repo_data.get("default_branch", "main")
 
             # Get the tree
             tree_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{default_branch}"
             if recursive:
                 tree_url += "?recursive=1"
 
-            async with await self._http_client() as client:
+            async with get_github_semaphore():
                 resp = await client.get(tree_url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
             tree_items = data.get("tree", [])[:max_items]
 
@@ -448,16 +468,16 @@ class GitHubProvider(BaseProvider):
             Dict with diff content
         """
         try:
-            headers = self._get_headers()
             # Request raw diff format
-            headers["Accept"] = "application/vnd.github.diff"
+            headers = {**get_github_headers(), "Accept": "application/vnd.github.diff"}
 
             url = f"https://api.github.com/repos/{owner}/{repo}/compare/{base}...{head}"
 
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_github_semaphore():
                 resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                diff_content = resp.text
+            resp.raise_for_status()
+            diff_content = resp.text
 
             return {
                 "repository": f"{owner}/{repo}",
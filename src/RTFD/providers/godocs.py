@@ -59,10 +59,10 @@ class GoDocsProvider(BaseProvider):
         # We'll use a curl-like User-Agent for this specific request.
         url = f"https://godocs.io/{package}"
         headers = {"User-Agent": "curl/7.68.0"}
-        async with await self._http_client() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+        client = await self._http_client()
+        resp = await client.get(url, headers=headers)
+        resp.raise_for_status()
+        soup = BeautifulSoup(resp.text, "lxml")
 
         # Extract description/synopsis
         description = ""
@@ -115,10 +115,10 @@ class GoDocsProvider(BaseProvider):
             url = f"https://godocs.io/{package}"
             headers = {"User-Agent": "curl/7.68.0"}
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._http_client()
+            resp = await client.get(url, headers=headers)
+            resp.raise_for_status()
+            soup = BeautifulSoup(resp.text, "lxml")
 
             # Extract comprehensive documentation content
             content_parts = []
@@ -49,10 +49,10 @@ class NpmProvider(BaseProvider):
     async def _fetch_metadata(self, package: str) -> dict[str, Any]:
         """Pull package metadata from the npm registry JSON API."""
         url = f"https://registry.npmjs.org/{package}"
-        async with await self._http_client() as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            payload = resp.json()
+        client = await self._http_client()
+        resp = await client.get(url)
+        resp.raise_for_status()
+        payload = resp.json()
 
         # Extract repository URL
         repo_url = None
@@ -111,10 +111,10 @@ class NpmProvider(BaseProvider):
         try:
             url = f"https://registry.npmjs.org/{package}"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._http_client()
+            resp = await client.get(url)
+            resp.raise_for_status()
+            data = resp.json()
 
             # npm registry includes README in "readme" field (already Markdown)
             content = data.get("readme", "")
@@ -3,20 +3,43 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
+import orjson
 from mcp.types import CallToolResult
 
+from ..cache import CacheManager, default_cache_path
 from ..content_utils import convert_rst_to_markdown, extract_sections, prioritize_sections
-from ..utils import is_fetch_enabled, serialize_response_with_meta
+from ..utils import (
+    cached,
+    get_cache_config,
+    get_pypi_semaphore,
+    is_fetch_enabled,
+    serialize_response_with_meta,
+)
 from .base import BaseProvider, ProviderMetadata, ProviderResult
 
+# In-memory cache lifetime (seconds) for package metadata
+METADATA_CACHE_TTL = 600.0
+
+# Database file (in ~/.cache/rtfd) holding package summaries and their HTTP validators
+PYPI_CACHE_DB = "pypi.db"
+
+# Version of the stored summary shape; bump it whenever _fetch_package_info's fields change
+# so summaries written by an older release are refetched instead of revalidated
+PYPI_CACHE_SCHEMA = 1
+
 
 class PyPIProvider(BaseProvider):
     """Provider for PyPI package metadata."""
 
+    def __init__(self, http_client_factory: Callable[[], Awaitable[httpx.AsyncClient]]):
+        super().__init__(http_client_factory)
+        self._disk_cache: CacheManager | None = None
+
     def get_metadata(self) -> ProviderMetadata:
         tool_names = ["pypi_metadata"]
         if is_fetch_enabled():
@@ -29,7 +52,7 @@ class PyPIProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=True,
             required_env_vars=[],
-            optional_env_vars=["VERIFIED_BY_PYPI"],
+            optional_env_vars=["VERIFIED_BY_PYPI", "PYPI_MAX_CONCURRENCY"],
         )
 
     async def search_library(self, library: str, limit: int = 5) -> ProviderResult:
@@ -52,11 +75,12 @@ class PyPIProvider(BaseProvider):
         """
         url = f"https://pypi.org/project/{package}/"
         try:
-            async with await self._http_client() as client:
+            client = await self._http_client()
+            async with get_pypi_semaphore():
                 resp = await client.get(url)
-                resp.raise_for_status()
-                # Simple check for the verified class in the HTML
-                return 'class="sidebar-section verified"' in resp.text
+            resp.raise_for_status()
+            # Simple check for the verified class in the HTML
+            return 'class="sidebar-section verified"' in resp.text
         except Exception:
             # If we can't check, assume unverified or fail safe?
             # Let's assume unverified to be safe if verification is required.
@@ -77,14 +101,70 @@ class PyPIProvider(BaseProvider):
                     "is_unverified": True,
                 }
 
+        return await cached(
+            ("pypi", package), METADATA_CACHE_TTL, lambda: self._fetch_package_info(package)
+        )
+
+    def _get_disk_cache(self) -> CacheManager | None:
+        """
+        Get the persistent cache used for conditional requests, or None if caching is off.
+
+        Kept in its own database file so these entries aren't listed among the search results;
+        get_cache_info reports it via get_cache_stats(). Entries older than RTFD_CACHE_TTL are pruned
+        when the cache is first opened.
+        """
+        enabled, ttl = get_cache_config()
+        if not enabled:
+            return None
+        if self._disk_cache is None:
+            self._disk_cache = CacheManager(db_path=default_cache_path(PYPI_CACHE_DB))
+            self._disk_cache.cleanup(ttl)
+        return self._disk_cache
+
+    def get_cache_stats(self) -> dict[str, Any] | None:
+        """Return statistics for the conditional-request cache, or None if caching is off."""
+        disk_cache = self._get_disk_cache()
+        return disk_cache.get_stats() if disk_cache else None
+
+    async def _fetch_package_info(self, package: str) -> dict[str, Any]:
+        """
+        Fetch and summarize a package's info block from the PyPI JSON API.
+
+        The summary is persisted with the response's ETag / Last-Modified validators, so
+        later lookups send a conditional request and reuse it when PyPI answers 304.
+        Stored summaries older than RTFD_CACHE_TTL are ignored and fetched in full.
+        """
         url = f"https://pypi.org/pypi/{package}/json"
-        async with await self._http_client() as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            payload = resp.json()
+        cache_key = f"pypi:v{PYPI_CACHE_SCHEMA}:{package}"
+        disk_cache = self._get_disk_cache()
+        entry = disk_cache.get(cache_key) if disk_cache else None
+        if entry is not None and time.time() - entry.timestamp >= get_cache_config()[1]:
+            entry = None
+
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.metadata.get("etag"):
+                headers["If-None-Match"] = entry.metadata["etag"]
+            if entry.metadata.get("last_modified"):
+                headers["If-Modified-Since"] = entry.metadata["last_modified"]
+
+        client = await self._http_client()
+        async with get_pypi_semaphore():
+            resp = await client.get(url, headers=headers)
+
+        if resp.status_code == 304 and entry is not None:
+            # Unchanged upstream: reuse the stored summary and skip the body entirely, and
+            # restart its RTFD_CACHE_TTL since PyPI just confirmed it is current
+            disk_cache.touch(cache_key)
+            return entry.data
+
+        resp.raise_for_status()
+        # Decode straight from the raw bytes; PyPI payloads (with the full
+        # release history) are large enough for orjson to matter here
+        payload = orjson.loads(resp.content)
 
         info = payload.get("info", {})
-        return {
+        result = {
             "name": info.get("name"),
             "summary": info.get("summary") or "",
             "version": info.get("version"),
@@ -96,6 +176,15 @@ class PyPIProvider(BaseProvider):
             "description": info.get("description") or "",
         }
 
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        if disk_cache is not None and any(validators.values()):
+            disk_cache.set(cache_key, result, validators)
+
+        return result
+
     def _extract_github_url(self, project_urls: dict[str, str]) -> str | None:
         """Extract GitHub repository URL from project_urls."""
         if not project_urls:
@@ -8,26 +8,77 @@ in the aggregated search_library_docs tool.
 
 from __future__ import annotations
 
+import asyncio
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from mcp.types import CallToolResult
 
 from .cache import CacheManager
 from .providers import discover_providers
 from .providers.base import BaseProvider
-from .utils import create_http_client, get_cache_config, serialize_response_with_meta
+from .utils import (
+    close_http_client,
+    get_cache_config,
+    get_http_client,
+    serialize_response_with_meta,
+    single_flight,
+)
+
+# Provider instances (initialized on first use)
+_provider_instances: dict[str, BaseProvider] = {}
+
+# Aggregator result keys for providers whose key differs from the provider name
+_RESULT_KEYS = {
+    "github": "github_repos",
+}
+
+# Subset of provider instances that support library search (computed on first use)
+_library_search_providers: list[tuple[str, BaseProvider]] = []
+
+# Aggregator lookups currently running, keyed by (library, limit)
+_inflight_searches: dict[tuple[str, int], asyncio.Task[dict[str, Any]]] = {}
+
+
+# Hosts hit by nearly every library search; connecting early hides the first TCP + TLS setup.
+# GitHub's /rate_limit endpoint does not count against the (unauthenticated) API quota.
+_WARMUP_URLS = (
+    "https://pypi.org/",
+    "https://api.github.com/rate_limit",
+)
+
+
+async def _warm_up_connections() -> None:
+    """Open pooled keep-alive connections to common upstream hosts (failures are ignored)."""
+    client = await get_http_client()
+    await asyncio.gather(*(client.head(url) for url in _WARMUP_URLS), return_exceptions=True)
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Warm up upstream connections on startup and close the shared HTTP client on shutdown."""
+    warmup = asyncio.create_task(_warm_up_connections())
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        # Shutdown is often driven by cancelling the server's scope; shield the cleanup so
+        # these awaits don't re-raise CancelledError before the client is closed
+        with anyio.CancelScope(shield=True):
+            await asyncio.gather(warmup, return_exceptions=True)
+            await close_http_client()
+
 
 # Initialize FastMCP server
-mcp = FastMCP("RTFD!")
+mcp = FastMCP("RTFD!", lifespan=_lifespan)
 
 # Initialize Cache
 _cache_manager = CacheManager()
 
-# Provider instances (initialized on first use)
-_provider_instances: dict[str, BaseProvider] = {}
-
 
 def _get_provider_instances() -> dict[str, BaseProvider]:
     """
@@ -42,7 +93,7 @@ def _get_provider_instances() -> dict[str, BaseProvider]:
 
     for name, provider_class in provider_classes.items():
         try:
-            instance = provider_class(create_http_client)
+            instance = provider_class(get_http_client)
             _provider_instances[name] = instance
         except Exception as e:
             # Log but don't crash - defensive initialization
@@ -51,6 +102,22 @@ def _get_provider_instances() -> dict[str, BaseProvider]:
     return _provider_instances
 
 
+def _get_library_search_providers() -> list[tuple[str, BaseProvider]]:
+    """
+    Get (name, provider) pairs that participate in search_library_docs.
+
+    Provider metadata is static, so the list is computed once instead of calling
+    get_metadata() on every provider for every aggregator request.
+    """
+    if not _library_search_providers:
+        _library_search_providers.extend(
+            (name, provider)
+            for name, provider in _get_provider_instances().items()
+            if provider.get_metadata().supports_library_search
+        )
+    return _library_search_providers
+
+
 def _register_provider_tools() -> None:
     """
     Discover and register all provider tools with FastMCP.
@@ -84,7 +151,15 @@ async def _locate_library_docs(library: str, limit: int = 5) -> dict[str, Any]:
     Try to find documentation links for a given library using all available providers.
 
     This is the aggregator function that combines results from PyPI, GoDocs, and GitHub.
+    Concurrent calls with the same arguments share a single lookup.
     """
+    return await single_flight(
+        _inflight_searches, (library, limit), lambda: _search_library_providers(library, limit)
+    )
+
+
+async def _search_library_providers(library: str, limit: int) -> dict[str, Any]:
+    """Run one aggregator lookup: check the cache, then query every library-search provider."""
 
     result: dict[str, Any] = {"library": library}
 
@@ -106,34 +181,41 @@ async def _locate_library_docs(library: str, limit: int = 5) -> dict[str, Any]:
             if age < cache_ttl:
                 return cached_entry.data
 
-    providers = _get_provider_instances()
-
-    # Query each provider that supports library search
-    for provider_name, provider in providers.items():
-        metadata = provider.get_metadata()
-
-        if not metadata.supports_library_search:
+    search_providers = _get_library_search_providers()
+
+    # Query every provider that supports library search concurrently
+    provider_results = await asyncio.gather(
+        *(provider.search_library(library, limit=limit) for _, provider in search_providers),
+        return_exceptions=True,
+    )
+
+    provider_raised = False
+    for (provider_name, _), provider_result in zip(search_providers, provider_results, strict=True):
+        if isinstance(provider_result, BaseException):
+            if not isinstance(provider_result, Exception):
+                raise provider_result
+            # Providers report expected failures via ProviderResult; surface anything
+            # else under the same error key so one provider can't sink the whole search
+            sys.stderr.write(
+                f"Warning: Provider {provider_name} search failed: {provider_result}\n"
+            )
+            result[f"{provider_name}_error"] = (
+                f"{type(provider_result).__name__}: {provider_result}"
+            )
+            provider_raised = True
             continue
 
-        provider_result = await provider.search_library(library, limit=limit)
-
         if provider_result.success:
-            # Success: add data to result
-            # Map provider name to appropriate result key
-            key_mapping = {
-                "pypi": "pypi",
-                "godocs": "godocs",
-                "github": "github_repos",
-            }
-            result_key = key_mapping.get(provider_name, provider_name)
+            # Success: add data to result under the provider's result key
+            result_key = _RESULT_KEYS.get(provider_name, provider_name)
             result[result_key] = provider_result.data
         elif provider_result.error:
             # Error: add error message (skip if error is None - silent fail)
             error_key = f"{provider_name}_error"
             result[error_key] = provider_result.error
 
-    # Update cache if enabled
-    if cache_enabled:
+    # Update cache if enabled (unexpected failures are likely transient, so don't persist them)
+    if cache_enabled and not provider_raised:
         _cache_manager.set(cache_key, result)
 
     return result
@@ -152,6 +234,12 @@ async def search_library_docs(library: str, limit: int = 5) -> CallToolResult:
 async def get_cache_info() -> CallToolResult:
     """Return cache statistics including entry count and size."""
     stats = _cache_manager.get_stats()
+    provider_caches = {}
+    for name, provider in _get_provider_instances().items():
+        provider_stats = provider.get_cache_stats()
+        if provider_stats is not None:
+            provider_caches[name] = provider_stats
+    stats["provider_caches"] = provider_caches
     return serialize_response_with_meta(stats)
 
 
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import tiktoken
 
-# Use cl100k_base encoding (used by GPT-4, Claude, and most modern LLMs)
-_encoding = tiktoken.get_encoding("cl100k_base")
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """
+    Load the cl100k_base encoding (used by GPT-4, Claude, and most modern LLMs).
+
+    Loaded on first use rather than at import: building the BPE ranks (and downloading
+    them on a cold tiktoken cache) is the slowest step of server startup.
+    """
+    return tiktoken.get_encoding("cl100k_base")
 
 
 def count_tokens(text: str) -> int:
@@ -18,4 +28,4 @@ def count_tokens(text: str) -> int:
     Returns:
         Number of tokens
     """
-    return len(_encoding.encode(text))
+    return len(_get_encoding().encode(text))
@@ -2,24 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import os
 import shutil
 import subprocess
-from typing import Any
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from typing import Any, TypeVar
 
 import httpx
+import orjson
 from loguru import logger
 from mcp.types import CallToolResult, TextContent
 
 from .token_counter import count_tokens
 
+T = TypeVar("T")
+
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/118.0 Safari/537.36"
 )
 DEFAULT_TIMEOUT = 15.0
 
+# Connection pool sizing shared by every HTTP client the server creates
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+# Idle connections are kept for 5 minutes: tool calls arrive at a human's pace, and the
+# startup warm-up is only useful if its connections outlive the wait for the first prompt
+KEEPALIVE_EXPIRY = 300.0
+
+# Maximum number of entries kept by the in-memory response cache
+MEMORY_CACHE_MAXSIZE = 512
+
+# Seconds a stale entry is served again after a failed refresh before retrying upstream
+STALE_RETRY_TTL = 30.0
+
+# Stale entries are only served until they are this many ttls old (counted from the fetch)
+STALE_MAX_TTLS = 6
+
+# Default per-host cap on in-flight requests (kept below MAX_CONNECTIONS)
+DEFAULT_MAX_CONCURRENCY = 50
+
 
 def is_fetch_enabled() -> bool:
     """
@@ -36,22 +63,68 @@ async def create_http_client() -> httpx.AsyncClient:
     """
     Create a configured HTTP client for provider use.
 
-    Centralizes timeout, user-agent, and redirect configuration.
+    Centralizes timeout, user-agent, redirect, and connection pool configuration.
+    HTTP/2 is negotiated where the host supports it so concurrent requests to
+    the same host share one connection. Accept-Encoding is left to httpx, which
+    advertises gzip, deflate, and br (brotli is installed via httpx[brotli]).
+    Each call returns a new client; providers should use `get_http_client()` instead.
     """
     return httpx.AsyncClient(
+        http1=True,
+        http2=True,
         timeout=DEFAULT_TIMEOUT,
         follow_redirects=True,
         headers={"User-Agent": USER_AGENT, "Accept": "*/*"},
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
     )
 
 
+# One pooled client per event loop (a client cannot be shared across loops)
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the running event loop, creating it on first use.
+
+    An httpx client can't be shared across event loops, so one is kept per loop. Within
+    a loop every provider shares this client so connections (and TLS sessions) to PyPI,
+    GitHub, and the other hosts stay pooled between tool calls. Callers must not
+    close it or use it as a context manager; call `close_http_client()` on shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = await create_http_client()
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client for the running event loop, if one was created."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON, stringifying unsupported types and non-str keys."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 def serialize_response(data: Any) -> str:
     """
     Convert data to string format.
 
-    Uses JSON with proper escape handling for control characters.
+    Uses orjson, which escapes control characters and emits compact UTF-8 JSON.
     """
-    return json.dumps(data, ensure_ascii=True, default=str)
+    return _dumps(data).decode("utf-8")
 
 
 def serialize_response_with_meta(data: Any) -> CallToolResult:
@@ -74,7 +147,8 @@ def serialize_response_with_meta(data: Any) -> CallToolResult:
     """
     track_tokens = os.getenv("RTFD_TRACK_TOKENS", "false").lower() == "true"
 
-    response_text = json.dumps(data, ensure_ascii=True, default=str)
+    response_bytes = _dumps(data)
+    response_text = response_bytes.decode("utf-8")
 
     # If token tracking is disabled, just serialize to JSON
     if not track_tokens:
@@ -89,7 +163,7 @@ def serialize_response_with_meta(data: Any) -> CallToolResult:
             "tokens_json": token_count,
             "tokens_sent": token_count,
             "format": "json",
-            "bytes_json": len(response_text),
+            "bytes_json": len(response_bytes),
         }
 
         # Return CallToolResult with content and metadata
@@ -120,6 +194,194 @@ def get_cache_config() -> tuple[bool, float]:
     return enabled, ttl
 
 
+# Short-lived in-memory cache of upstream responses:
+# key -> (monotonic expiry, monotonic time fetched, value), ordered from least to most
+# recently used
+_memory_cache: OrderedDict[Hashable, tuple[float, float, Any]] = OrderedDict()
+
+# Refreshes currently running, keyed like _memory_cache
+_memory_cache_inflight: dict[Hashable, asyncio.Task[Any]] = {}
+
+
+def _store_cached(key: Hashable, ttl: float, value: Any, fetched_at: float | None = None) -> None:
+    """Store a value in the in-memory cache, evicting least recently used entries."""
+    now = time.monotonic()
+    _memory_cache[key] = (now + ttl, now if fetched_at is None else fetched_at, value)
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_MAXSIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _is_transient_http_error(exc: httpx.HTTPError) -> bool:
+    """
+    Check whether an HTTP error says nothing about the resource itself.
+
+    True for transport failures (timeouts, connection errors), 5xx and 429 responses, and
+    GitHub's rate-limit 403; authoritative answers such as 404, 401, or 422 are not.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    response = exc.response
+    if response.status_code >= 500 or response.status_code == 429:
+        return True
+    return response.status_code == 403 and response.headers.get("x-ratelimit-remaining") == "0"
+
+
+async def _refresh_cached(key: Hashable, ttl: float, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Call fetch() and store its value, falling back to an expired entry on transient errors.
+
+    A stale value is stored again for STALE_RETRY_TTL seconds (at most ttl), so callers
+    don't hit a failing upstream on every lookup, until it is STALE_MAX_TTLS ttls old.
+    """
+    try:
+        value = await fetch()
+    except httpx.HTTPError as exc:
+        entry = _memory_cache.get(key)
+        if (
+            entry is None
+            or not _is_transient_http_error(exc)
+            or time.monotonic() - entry[1] >= ttl * STALE_MAX_TTLS
+        ):
+            raise
+        logger.warning(f"Serving stale cache entry for {key!r} after error: {exc}")
+        _store_cached(key, min(ttl, STALE_RETRY_TTL), entry[2], fetched_at=entry[1])
+        return entry[2]
+    _store_cached(key, ttl, value)
+    return value
+
+
+async def single_flight(
+    registry: dict[Any, asyncio.Task[Any]],
+    key: Hashable,
+    make_coro: Callable[[], Coroutine[Any, Any, T]],
+) -> T:
+    """
+    Run make_coro() as one shared task per key and await its result.
+
+    While a task for key is in registry, later callers await it instead of starting
+    another, so they all get the same value or the same exception. The task removes
+    itself from registry when it finishes.
+
+    Args:
+        registry: Dict of in-flight tasks owned by the caller
+        key: Hashable key identifying the operation
+        make_coro: Zero-argument function creating the coroutine to run on a miss
+
+    Returns:
+        The shared task's result
+    """
+    task = registry.get(key)
+    if task is None:
+        task = asyncio.create_task(make_coro())
+        registry[key] = task
+
+        def _forget(done: asyncio.Task[Any]) -> None:
+            if registry.get(key) is done:
+                del registry[key]
+
+        task.add_done_callback(_forget)
+
+    # Shield the shared task so one caller being cancelled doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+
+async def cached(key: Hashable, ttl: float, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Return the in-memory cached value for key, calling fetch() on a miss.
+
+    Entries expire ttl seconds after being stored. Concurrent misses for the same key
+    await one shared fetch() and all get its value or its exception.
+    At most MEMORY_CACHE_MAXSIZE entries are kept (least recently used are evicted).
+    Exceptions raised by fetch() are not cached; if fetch() fails with a transient HTTP
+    error (transport failure, 5xx, 429, or a rate-limit 403) and an expired entry fetched
+    less than STALE_MAX_TTLS ttls ago is still held, that last-known-good value is
+    returned instead and kept for STALE_RETRY_TTL seconds before the next refresh attempt.
+    Bypassed when RTFD_CACHE_ENABLED is false.
+
+    Args:
+        key: Hashable cache key (e.g., ("pypi", "requests"))
+        ttl: Time-to-live in seconds
+        fetch: Zero-argument coroutine function producing the value
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    enabled, _ = get_cache_config()
+    if not enabled:
+        return await fetch()
+
+    entry = _memory_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _memory_cache.move_to_end(key)
+        return entry[2]
+
+    return await single_flight(
+        _memory_cache_inflight, key, lambda: _refresh_cached(key, ttl, fetch)
+    )
+
+
+def get_max_concurrency(env_var: str) -> int:
+    """
+    Get the maximum number of concurrent requests allowed against one upstream host.
+
+    Read from the given environment variable (default: DEFAULT_MAX_CONCURRENCY) and
+    clamped to [1, MAX_CONNECTIONS] so admission never exceeds the connection pool.
+
+    Args:
+        env_var: Environment variable holding the limit (e.g., "GITHUB_MAX_CONCURRENCY")
+
+    Returns:
+        Concurrency limit to use for an asyncio.Semaphore
+    """
+    try:
+        value = int(os.getenv(env_var, str(DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        value = DEFAULT_MAX_CONCURRENCY
+    return max(1, min(value, MAX_CONNECTIONS))
+
+
+# Per-host request semaphores, kept per event loop (a semaphore binds to the loop it first
+# waits on, so one created for another loop can't be reused)
+_host_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def get_host_semaphore(host: str, env_var: str) -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding in-flight requests to one upstream host across all providers.
+
+    Created on first use on the running event loop and sized from env_var (see
+    get_max_concurrency), so every provider calling the host shares one allowance.
+
+    Args:
+        host: Short name identifying the upstream host (e.g., "github")
+        env_var: Environment variable holding the limit (e.g., "GITHUB_MAX_CONCURRENCY")
+
+    Returns:
+        Semaphore to hold around each request to the host
+    """
+    semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_max_concurrency(env_var))
+        semaphores[host] = semaphore
+    return semaphore
+
+
+def get_github_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore shared by the GitHub and GCP providers for api.github.com requests."""
+    return get_host_semaphore("github", "GITHUB_MAX_CONCURRENCY")
+
+
+def get_pypi_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding requests to pypi.org."""
+    return get_host_semaphore("pypi", "PYPI_MAX_CONCURRENCY")
+
+
 def get_github_token() -> str | None:
     """
     Get GitHub token based on configured authentication method.
@@ -163,3 +425,23 @@ def get_github_token() -> str | None:
 
     logger.error("GitHub token not found via configured methods")
     return None
+
+
+@functools.cache
+def get_github_headers() -> dict[str, str]:
+    """
+    Get GitHub API headers with optional auth token, shared by the GitHub and GCP providers.
+
+    Built once per process on first use, so the token is resolved (env lookup or
+    `gh auth token`) only once; rotating it requires a restart.
+    Callers must not mutate the returned dict.
+    """
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    token = get_github_token()
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
@@ -49,6 +49,22 @@ def test_cache_invalidate(cache_manager):
     assert entry is None
 
 
+def test_cache_touch(cache_manager, monkeypatch):
+    """Test that touching a value refreshes its timestamp and keeps its data."""
+    key = "test_key"
+    data = {"foo": "bar"}
+    cache_manager.set(key, data, {"etag": '"abc"'})
+    stored_at = cache_manager.get(key).timestamp
+
+    monkeypatch.setattr(time, "time", lambda: stored_at + 100)
+    cache_manager.touch(key)
+
+    entry = cache_manager.get(key)
+    assert entry.timestamp == stored_at + 100
+    assert entry.data == data
+    assert entry.metadata == {"etag": '"abc"'}
+
+
 def test_cache_cleanup(cache_manager):
     """Test cleaning up expired values."""
     # Set an entry with a timestamp in the past
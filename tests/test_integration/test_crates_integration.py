@@ -3,13 +3,13 @@
 import pytest
 
 from RTFD.providers.crates import CratesProvider
-from RTFD.utils import create_http_client
+from RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create Crates provider instance."""
-    return CratesProvider(create_http_client)
+    return CratesProvider(get_http_client)
 
 
 @pytest.mark.integration
@@ -16,13 +16,13 @@ Note: GitHub API calls may require GITHUB_TOKEN for higher rate limits.
 import pytest
 
 from RTFD.providers.gcp import GcpProvider
-from RTFD.utils import create_http_client
+from RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create GCP provider instance."""
-    return GcpProvider(create_http_client)
+    return GcpProvider(get_http_client)
 
 
 @pytest.mark.integration
@@ -3,13 +3,13 @@
 import pytest
 
 from RTFD.providers.github import GitHubProvider
-from RTFD.utils import create_http_client
+from RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create GitHub provider instance."""
-    return GitHubProvider(create_http_client)
+    return GitHubProvider(get_http_client)
 
 
 @pytest.mark.integration
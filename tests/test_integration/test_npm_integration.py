@@ -3,13 +3,13 @@
 import pytest
 
 from RTFD.providers.npm import NpmProvider
-from RTFD.utils import create_http_client
+from RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create npm provider instance."""
-    return NpmProvider(create_http_client)
+    return NpmProvider(get_http_client)
 
 
 @pytest.mark.integration
@@ -14,13 +14,13 @@ To run without network access (using existing cassettes):
 import pytest
 
 from RTFD.providers.pypi import PyPIProvider
-from RTFD.utils import create_http_client
+from RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create PyPI provider instance."""
-    return PyPIProvider(create_http_client)
+    return PyPIProvider(get_http_client)
 
 
 @pytest.mark.integration
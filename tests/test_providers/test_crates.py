@@ -7,13 +7,13 @@ import httpx
 import pytest
 
 from src.RTFD.providers.crates import CratesProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a Crates provider instance."""
-    return CratesProvider(create_http_client)
+    return CratesProvider(get_http_client)
 
 
 @pytest.fixture
@@ -2,14 +2,14 @@
 
 import pytest
 
-from src.RTFD.providers.github import GitHubProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.providers.github import MAX_PER_PAGE, GitHubProvider, _per_page
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a GitHub provider instance."""
-    return GitHubProvider(create_http_client)
+    return GitHubProvider(get_http_client)
 
 
 def test_github_metadata():
@@ -295,3 +295,10 @@ async def test_get_repo_tree_tool(provider):
     except Exception as e:
         # May fail due to rate limits
         assert "403" in str(e) or "rate limit" in str(e).lower()
+
+
+def test_github_per_page_clamped():
+    """Test that search page sizes stay within GitHub's accepted range."""
+    assert _per_page(5) == "5"
+    assert _per_page(500) == str(MAX_PER_PAGE)
+    assert _per_page(0) == "1"
@@ -6,13 +6,13 @@ import httpx
 import pytest
 
 from src.RTFD.providers.godocs import GoDocsProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a GoDocs provider instance."""
-    return GoDocsProvider(create_http_client)
+    return GoDocsProvider(get_http_client)
 
 
 @pytest.fixture
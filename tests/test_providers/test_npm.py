@@ -6,13 +6,13 @@ import httpx
 import pytest
 
 from src.RTFD.providers.npm import NpmProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a NPM provider instance."""
-    return NpmProvider(create_http_client)
+    return NpmProvider(get_http_client)
 
 
 @pytest.fixture
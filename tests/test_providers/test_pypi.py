@@ -1,15 +1,19 @@
 """Tests for PyPI provider."""
 
+import time
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from src.RTFD.cache import CacheManager
 from src.RTFD.providers.pypi import PyPIProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a PyPI provider instance."""
-    return PyPIProvider(create_http_client)
+    return PyPIProvider(get_http_client)
 
 
 def test_pypi_metadata():
@@ -82,3 +86,97 @@ async def test_pypi_metadata_tool(provider):
     assert "requests" in text_content  # Should contain package name
     assert "2." in text_content  # Should contain version number
     assert "{" in text_content  # Should be JSON
+
+
+@pytest.mark.asyncio
+async def test_pypi_revalidates_with_etag(tmp_path, monkeypatch):
+    """Test that a cached summary is reused when PyPI answers 304 Not Modified."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+
+    fresh = MagicMock()
+    fresh.status_code = 200
+    fresh.content = b'{"info": {"name": "demo", "version": "1.0"}}'
+    fresh.headers = {"ETag": '"abc"'}
+    fresh.raise_for_status.return_value = None
+
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+
+    mock_client = AsyncMock()
+    mock_client.get.side_effect = [fresh, not_modified]
+
+    async def mock_factory():
+        return mock_client
+
+    provider = PyPIProvider(mock_factory)
+    provider._disk_cache = CacheManager(db_path=str(tmp_path / "cache.db"))
+
+    first = await provider._fetch_package_info("demo")
+    stored_at = provider._disk_cache.get("pypi:v1:demo").timestamp
+    monkeypatch.setattr(time, "time", lambda: stored_at + 100)
+    second = await provider._fetch_package_info("demo")
+
+    assert first["version"] == "1.0"
+    assert second == first
+    assert mock_client.get.call_args_list[0].kwargs["headers"] == {}
+    assert mock_client.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+    not_modified.raise_for_status.assert_not_called()
+    # A 304 restarts the stored entry's expiry clock
+    assert provider._disk_cache.get("pypi:v1:demo").timestamp == stored_at + 100
+
+
+@pytest.mark.asyncio
+async def test_pypi_skips_expired_disk_cache_entry(tmp_path, monkeypatch):
+    """Test that a stored summary older than RTFD_CACHE_TTL is not revalidated."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+    monkeypatch.setenv("RTFD_CACHE_TTL", "60")
+
+    fresh = MagicMock()
+    fresh.status_code = 200
+    fresh.content = b'{"info": {"name": "demo", "version": "2.0"}}'
+    fresh.headers = {"ETag": '"new"'}
+    fresh.raise_for_status.return_value = None
+
+    mock_client = AsyncMock()
+    mock_client.get.return_value = fresh
+
+    async def mock_factory():
+        return mock_client
+
+    provider = PyPIProvider(mock_factory)
+    provider._disk_cache = CacheManager(db_path=str(tmp_path / "cache.db"))
+    provider._disk_cache.set("pypi:v1:demo", {"version": "1.0"}, {"etag": '"old"'})
+    stored_at = provider._disk_cache.get("pypi:v1:demo").timestamp
+    monkeypatch.setattr(time, "time", lambda: stored_at + 61)
+
+    result = await provider._fetch_package_info("demo")
+
+    assert result["version"] == "2.0"
+    assert mock_client.get.call_args.kwargs["headers"] == {}
+
+
+def test_pypi_disk_cache_is_separate_from_search_cache(tmp_path, monkeypatch):
+    """Test that validator entries live outside the search cache database."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+
+    disk_cache = PyPIProvider(get_http_client)._get_disk_cache()
+
+    assert disk_cache.db_path == str(tmp_path / ".cache" / "rtfd" / "pypi.db")
+    assert disk_cache.db_path != CacheManager().db_path
+
+
+def test_pypi_cache_stats_follow_cache_config(tmp_path, monkeypatch):
+    """Test that cache stats come from the provider's database and skip it when disabled."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "false")
+    provider = PyPIProvider(get_http_client)
+
+    assert provider.get_cache_stats() is None
+    assert not (tmp_path / ".cache" / "rtfd" / "pypi.db").exists()
+
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+    stats = provider.get_cache_stats()
+
+    assert stats["db_path"] == str(tmp_path / ".cache" / "rtfd" / "pypi.db")
+    assert stats["entry_count"] == 0
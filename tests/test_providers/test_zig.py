@@ -7,13 +7,13 @@ import pytest
 from bs4 import BeautifulSoup
 
 from src.RTFD.providers.zig import ZigProvider
-from src.RTFD.utils import create_http_client
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
 def provider():
     """Create a Zig provider instance."""
-    return ZigProvider(create_http_client)
+    return ZigProvider(get_http_client)
 
 
 @pytest.fixture
@@ -1,11 +1,22 @@
 """Tests for MCP server and aggregator."""
 
+import asyncio
 import time
+from unittest.mock import AsyncMock, MagicMock
 
+import anyio
+import httpx
 import pytest
 
 from src.RTFD.cache import CacheEntry
-from src.RTFD.server import _get_provider_instances, _locate_library_docs, search_library_docs
+from src.RTFD.providers.base import BaseProvider, ProviderMetadata, ProviderResult
+from src.RTFD.server import (
+    _get_library_search_providers,
+    _get_provider_instances,
+    _locate_library_docs,
+    search_library_docs,
+)
+from src.RTFD.utils import get_http_client
 
 
 @pytest.fixture
@@ -27,6 +38,17 @@ def test_get_provider_instances_returns_all(provider_instances):
     assert "gcp" in provider_instances
 
 
+def test_get_library_search_providers():
+    """Test that only library-search providers are returned, and the list is cached."""
+    search_providers = _get_library_search_providers()
+
+    names = [name for name, _ in search_providers]
+    assert "pypi" in names
+    assert "github" in names
+    assert "zig" not in names
+    assert _get_library_search_providers() is search_providers
+
+
 def test_get_provider_instances_caches():
     """Test that provider instances are cached."""
     instances1 = _get_provider_instances()
@@ -89,7 +111,7 @@ async def test_search_library_docs_returns_json_string():
     text_content = result.content[0].text
     assert isinstance(text_content, str)
     # Check for JSON format indicators
-    assert '{"library": "requests"' in text_content
+    assert '{"library":"requests"' in text_content
     assert '"pypi":' in text_content
 
 
@@ -189,11 +211,173 @@ async def test_get_cache_info(monkeypatch):
     # Patch the global _cache_manager in server.py
     from src.RTFD import server
 
+    class MockProvider:
+        def __init__(self, stats):
+            self._stats = stats
+
+        def get_cache_stats(self):
+            return self._stats
+
     monkeypatch.setattr(server, "_cache_manager", MockCacheManager())
+    monkeypatch.setattr(
+        server,
+        "_get_provider_instances",
+        lambda: {
+            "pypi": MockProvider({"entry_count": 3, "db_path": "/tmp/pypi.db"}),
+            "npm": MockProvider(None),
+        },
+    )
 
     result = await get_cache_info()
 
     assert result.content[0].type == "text"
     text_content = result.content[0].text
-    assert '"entry_count": 10' in text_content
-    assert '"db_path": "/tmp/test.db"' in text_content
+    assert '"entry_count":10' in text_content
+    assert '"db_path":"/tmp/test.db"' in text_content
+    assert '"provider_caches":{"pypi":{"entry_count":3' in text_content
+    assert '"npm"' not in text_content
+
+
+class _FakeProvider(BaseProvider):
+    """Minimal provider used to exercise the aggregator without network access."""
+
+    def __init__(self, name, search):
+        super().__init__(lambda: None)
+        self._name = name
+        self._search = search
+
+    def get_metadata(self):
+        return ProviderMetadata(name=self._name, description="fake", supports_library_search=True)
+
+    async def search_library(self, library, limit=5):
+        return await self._search(library, limit)
+
+
+@pytest.mark.asyncio
+async def test_locate_library_docs_queries_providers_concurrently(monkeypatch):
+    """Test that providers are queried concurrently and failures don't sink the result."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "false")
+    second_started = asyncio.Event()
+
+    async def waits_for_second(library, limit):
+        # Deadlocks (and times out) if providers were awaited one after another
+        await second_started.wait()
+        return ProviderResult(success=True, data={"name": library}, provider_name="pypi")
+
+    async def signals_first(library, limit):
+        second_started.set()
+        return ProviderResult(success=False, error="boom", provider_name="npm")
+
+    async def raises(library, limit):
+        raise RuntimeError("unexpected")
+
+    from src.RTFD import server
+
+    fake_providers = [
+        ("pypi", _FakeProvider("pypi", waits_for_second)),
+        ("npm", _FakeProvider("npm", signals_first)),
+        ("broken", _FakeProvider("broken", raises)),
+    ]
+    monkeypatch.setattr(server, "_get_library_search_providers", lambda: fake_providers)
+
+    result = await asyncio.wait_for(_locate_library_docs("requests", limit=2), timeout=5)
+
+    assert result["pypi"] == {"name": "requests"}
+    assert result["npm_error"] == "boom"
+    assert "broken" not in result
+    assert result["broken_error"] == "RuntimeError: unexpected"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_connections_ignores_failures(monkeypatch):
+    """Test that startup warm-up touches each upstream host and swallows errors."""
+    from src.RTFD import server
+
+    mock_client = AsyncMock()
+    mock_client.head.side_effect = httpx.ConnectError("offline")
+    monkeypatch.setattr(server, "get_http_client", AsyncMock(return_value=mock_client))
+
+    await server._warm_up_connections()
+
+    called_urls = [call.args[0] for call in mock_client.head.call_args_list]
+    assert called_urls == list(server._WARMUP_URLS)
+
+
+@pytest.mark.asyncio
+async def test_locate_library_docs_does_not_cache_raised_provider(monkeypatch):
+    """Test that a result containing an unexpected provider exception is not cached."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+
+    async def succeeds(library, limit):
+        return ProviderResult(success=True, data={"name": library}, provider_name="pypi")
+
+    async def raises(library, limit):
+        raise RuntimeError("unexpected")
+
+    from src.RTFD import server
+
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = None
+    monkeypatch.setattr(server, "_cache_manager", mock_cache)
+
+    fake_providers = [("pypi", _FakeProvider("pypi", succeeds))]
+    monkeypatch.setattr(server, "_get_library_search_providers", lambda: fake_providers)
+    await _locate_library_docs("requests", limit=2)
+    mock_cache.set.assert_called_once()
+
+    mock_cache.reset_mock()
+    fake_providers.append(("broken", _FakeProvider("broken", raises)))
+    result = await _locate_library_docs("requests", limit=2)
+
+    assert result["broken_error"] == "RuntimeError: unexpected"
+    mock_cache.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_locate_library_docs_coalesces_identical_searches(monkeypatch):
+    """Test that concurrent searches for the same library share one provider lookup."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "false")
+    calls = []
+
+    async def slow_search(library, limit):
+        calls.append(library)
+        await asyncio.sleep(0.01)
+        return ProviderResult(success=True, data={"name": library}, provider_name="pypi")
+
+    from src.RTFD import server
+
+    fake_providers = [("pypi", _FakeProvider("pypi", slow_search))]
+    monkeypatch.setattr(server, "_get_library_search_providers", lambda: fake_providers)
+
+    results = await asyncio.gather(*(_locate_library_docs("requests", limit=2) for _ in range(3)))
+
+    assert all(r["pypi"] == {"name": "requests"} for r in results)
+    assert len(calls) == 1
+    assert not server._inflight_searches
+
+    await _locate_library_docs("requests", limit=2)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_client_when_cancelled(monkeypatch):
+    """Test that shutdown by cancellation still closes the shared HTTP client."""
+    from src.RTFD import server
+
+    async def never_finishes():
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(server, "_warm_up_connections", never_finishes)
+    clients = []
+
+    async def serve():
+        async with server._lifespan(server.mcp):
+            clients.append(await get_http_client())
+            await asyncio.sleep(3600)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(serve)
+        await asyncio.sleep(0.01)
+        tg.cancel_scope.cancel()
+
+    assert clients[0].is_closed
@@ -0,0 +1,219 @@
+"""Tests for the in-memory TTL cache in utils.py."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.RTFD import utils
+from src.RTFD.utils import cached
+
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache(monkeypatch):
+    """Start every test with an empty cache and caching enabled."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "true")
+    utils._memory_cache.clear()
+    yield
+    utils._memory_cache.clear()
+
+
+def make_fetch(value="value"):
+    """Build a fetch coroutine function that counts its calls."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_cached_returns_cached_value():
+    """Test that a second lookup within the TTL does not call fetch again."""
+    fetch, calls = make_fetch()
+
+    assert await cached(("test", "hit"), 60, fetch) == "value"
+    assert await cached(("test", "hit"), 60, fetch) == "value"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_expires(monkeypatch):
+    """Test that entries are refetched once the TTL has passed."""
+    fetch, calls = make_fetch()
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+
+    await cached(("test", "expiry"), 10, fetch)
+    now[0] += 11
+    await cached(("test", "expiry"), 10, fetch)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_misses():
+    """Test that concurrent misses for one key share a single fetch."""
+    fetch, calls = make_fetch()
+
+    results = await asyncio.gather(*[cached(("test", "coalesce"), 60, fetch) for _ in range(5)])
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert ("test", "coalesce") not in utils._memory_cache_inflight
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_failures():
+    """Test that concurrent misses share one failing fetch and all get its exception."""
+    calls = []
+
+    async def failing_fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise ValueError("upstream failed")
+
+    results = await asyncio.gather(
+        *[cached(("test", "fail"), 60, failing_fetch) for _ in range(5)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 1
+    assert ("test", "fail") not in utils._memory_cache_inflight
+
+
+@pytest.mark.asyncio
+async def test_cached_does_not_cache_errors():
+    """Test that exceptions propagate and are not stored."""
+
+    async def failing_fetch():
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError):
+        await cached(("test", "error"), 60, failing_fetch)
+
+    assert ("test", "error") not in utils._memory_cache
+
+
+@pytest.mark.asyncio
+async def test_cached_evicts_least_recently_used(monkeypatch):
+    """Test that the cache stays bounded and evicts the least recently used entry."""
+    monkeypatch.setattr(utils, "MEMORY_CACHE_MAXSIZE", 2)
+    fetch, calls = make_fetch()
+
+    await cached(("test", "a"), 60, fetch)
+    await cached(("test", "b"), 60, fetch)
+    await cached(("test", "a"), 60, fetch)  # refresh "a" so "b" is the oldest
+    await cached(("test", "c"), 60, fetch)
+
+    assert list(utils._memory_cache) == [("test", "a"), ("test", "c")]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_serves_stale_on_http_error(monkeypatch):
+    """Test that an expired entry is returned to every caller when one refetch fails."""
+    fetch, _ = make_fetch("old")
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    calls = []
+
+    async def failing_fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise httpx.ConnectError("upstream down")
+
+    await cached(("test", "stale"), 60, fetch)
+    now[0] += 61
+
+    results = await asyncio.gather(
+        *[cached(("test", "stale"), 60, failing_fetch) for _ in range(5)]
+    )
+    assert results == ["old"] * 5
+    assert len(calls) == 1
+
+    # The stale value is kept for a short while instead of retrying on every lookup
+    now[0] += utils.STALE_RETRY_TTL - 1
+    assert await cached(("test", "stale"), 60, failing_fetch) == "old"
+    assert len(calls) == 1
+
+    now[0] += 2
+    assert await cached(("test", "stale"), 60, failing_fetch) == "old"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_does_not_serve_stale_on_not_found(monkeypatch):
+    """Test that an authoritative 404 propagates instead of serving the expired entry."""
+    fetch, _ = make_fetch("old")
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    request = httpx.Request("GET", "https://pypi.org/pypi/gone/json")
+
+    async def not_found_fetch():
+        raise httpx.HTTPStatusError(
+            "not found", request=request, response=httpx.Response(404, request=request)
+        )
+
+    await cached(("test", "gone"), 60, fetch)
+    now[0] += 61
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await cached(("test", "gone"), 60, not_found_fetch)
+
+
+@pytest.mark.asyncio
+async def test_cached_serves_stale_on_server_error(monkeypatch):
+    """Test that a 5xx refresh failure still falls back to the expired entry."""
+    fetch, _ = make_fetch("old")
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    request = httpx.Request("GET", "https://pypi.org/pypi/demo/json")
+
+    async def unavailable_fetch():
+        raise httpx.HTTPStatusError(
+            "unavailable", request=request, response=httpx.Response(503, request=request)
+        )
+
+    await cached(("test", "5xx"), 60, fetch)
+    now[0] += 61
+
+    assert await cached(("test", "5xx"), 60, unavailable_fetch) == "old"
+
+
+@pytest.mark.asyncio
+async def test_cached_stops_serving_stale_after_max_age(monkeypatch):
+    """Test that a stale entry is not served once it is STALE_MAX_TTLS ttls old."""
+    fetch, _ = make_fetch("old")
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+
+    async def failing_fetch():
+        raise httpx.ConnectError("upstream down")
+
+    await cached(("test", "max-age"), 60, fetch)
+
+    # Repeated failures keep serving the value, but re-storing it doesn't extend its age
+    now[0] += 61
+    while now[0] - 1000.0 < 60 * utils.STALE_MAX_TTLS:
+        assert await cached(("test", "max-age"), 60, failing_fetch) == "old"
+        now[0] += utils.STALE_RETRY_TTL + 1
+
+    with pytest.raises(httpx.ConnectError):
+        await cached(("test", "max-age"), 60, failing_fetch)
+
+
+@pytest.mark.asyncio
+async def test_cached_disabled(monkeypatch):
+    """Test that RTFD_CACHE_ENABLED=false bypasses the cache."""
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "false")
+    fetch, calls = make_fetch()
+
+    await cached(("test", "disabled"), 60, fetch)
+    await cached(("test", "disabled"), 60, fetch)
+
+    assert len(calls) == 2
@@ -0,0 +1,93 @@
+"""Tests for per-host concurrency limits in utils.py."""
+
+import asyncio
+import weakref
+
+import pytest
+
+from src.RTFD import utils
+from src.RTFD.utils import (
+    DEFAULT_MAX_CONCURRENCY,
+    MAX_CONNECTIONS,
+    get_github_semaphore,
+    get_max_concurrency,
+    get_pypi_semaphore,
+    single_flight,
+)
+
+
+def test_get_max_concurrency_default(monkeypatch):
+    """Test that the default limit is used when the variable is unset."""
+    monkeypatch.delenv("GITHUB_MAX_CONCURRENCY", raising=False)
+    assert get_max_concurrency("GITHUB_MAX_CONCURRENCY") == DEFAULT_MAX_CONCURRENCY
+
+
+def test_get_max_concurrency_from_env(monkeypatch):
+    """Test that the limit is read from the environment."""
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "8")
+    assert get_max_concurrency("GITHUB_MAX_CONCURRENCY") == 8
+
+
+def test_get_max_concurrency_clamped(monkeypatch):
+    """Test that out-of-range values are clamped to the connection pool size."""
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "1000")
+    assert get_max_concurrency("GITHUB_MAX_CONCURRENCY") == MAX_CONNECTIONS
+
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "0")
+    assert get_max_concurrency("GITHUB_MAX_CONCURRENCY") == 1
+
+
+def test_get_max_concurrency_invalid(monkeypatch):
+    """Test that invalid values fall back to the default."""
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "lots")
+    assert get_max_concurrency("GITHUB_MAX_CONCURRENCY") == DEFAULT_MAX_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_host_semaphores_are_shared_per_host(monkeypatch):
+    """Test that callers on one event loop share one semaphore per host."""
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("PYPI_MAX_CONCURRENCY", "4")
+    monkeypatch.setattr(utils, "_host_semaphores", weakref.WeakKeyDictionary())
+
+    github = get_github_semaphore()
+    pypi = get_pypi_semaphore()
+
+    assert get_github_semaphore() is github
+    assert get_pypi_semaphore() is pypi
+    assert github is not pypi
+    assert (github._value, pypi._value) == (3, 4)
+
+
+def test_host_semaphores_are_per_event_loop(monkeypatch):
+    """Test that a new event loop gets its own semaphore instead of a foreign-bound one."""
+    monkeypatch.setattr(utils, "_host_semaphores", weakref.WeakKeyDictionary())
+
+    async def get_semaphore():
+        return get_pypi_semaphore()
+
+    assert asyncio.run(get_semaphore()) is not asyncio.run(get_semaphore())
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_a_cancelled_caller():
+    """Test that cancelling one caller doesn't cancel the task shared with the others."""
+    registry = {}
+    release = asyncio.Event()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(single_flight(registry, "key", work))
+    second = asyncio.create_task(single_flight(registry, "key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    assert first.cancelled()
+    assert len(calls) == 1
+    assert not registry
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.RTFD.utils import get_github_token
+from src.RTFD.utils import get_github_headers, get_github_token
 
 
 @pytest.fixture(autouse=True)
@@ -20,9 +20,12 @@ def clear_env_vars():
         del os.environ["GITHUB_TOKEN"]
     if "GITHUB_AUTH" in os.environ:
         del os.environ["GITHUB_AUTH"]
+    get_github_headers.cache_clear()
 
     yield
 
+    get_github_headers.cache_clear()
+
     # Restore original values
     if original_github_token is not None:
         os.environ["GITHUB_TOKEN"] = original_github_token
@@ -134,3 +137,25 @@ def test_get_github_token_auto_method_no_token_no_cli():
     ):
         assert get_github_token() is None
         mock_logger.assert_called_once()
+
+
+def test_get_github_headers_without_token():
+    """Test get_github_headers when no token is available."""
+    with patch("src.RTFD.utils.get_github_token", return_value=None):
+        headers = get_github_headers()
+
+    assert "User-Agent" in headers
+    assert headers["Accept"] == "application/vnd.github+json"
+    assert "X-GitHub-Api-Version" in headers
+    assert "Authorization" not in headers
+
+
+def test_get_github_headers_built_once():
+    """Test that get_github_headers resolves the token once and is reused."""
+    with patch("src.RTFD.utils.get_github_token", return_value="abc") as mock_token:
+        headers1 = get_github_headers()
+        headers2 = get_github_headers()
+
+    assert headers1 is headers2
+    assert headers1["Authorization"] == "token abc"
+    mock_token.assert_called_once()
@@ -0,0 +1,27 @@
+"""Tests for the shared HTTP client in utils.py."""
+
+import pytest
+
+from src.RTFD.utils import close_http_client, get_http_client
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_is_shared():
+    """Test that repeated calls return the same pooled client."""
+    client1 = await get_http_client()
+    client2 = await get_http_client()
+    assert client1 is client2
+    assert not client1.is_closed
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_close_http_client_replaces_client():
+    """Test that closing the shared client makes the next call create a new one."""
+    client1 = await get_http_client()
+    await close_http_client()
+    assert client1.is_closed
+
+    client2 = await get_http_client()
+    assert client2 is not client1
+    await close_http_client()